@@ -1,25 +1,65 @@
+import os
+
+# Tesseract's OpenMP parallelism is a net slowdown on modern CPUs;
+# single-threaded LSTM is the fastest configuration. Must be set before
+# pytesseract/tesserocr are imported.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import streamlit as st
+import cv2
+import numpy as np
 from deep_translator import GoogleTranslator as translate
 from sumy.parsers.plaintext import PlaintextParser
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.lsa import LsaSummarizer
 from gtts import gTTS
-import os
 import nltk
 import pytesseract
 from PIL import Image
-import tempfile
-import uuid
+import hashlib
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import json
 import firebase_admin
 from firebase_admin import credentials, firestore
 
-# Download NLTK data for tokenization
+# tesserocr keeps the Tesseract API (and its language models) loaded in-process,
+# avoiding a subprocess spawn + model reload on every OCR call. Fall back to
+# pytesseract if it isn't available.
 try:
-    nltk.download('punkt', quiet=True)
-except Exception as e:
-    st.error(f"Error downloading NLTK data: {str(e)}")
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# Make sure the punkt tokenizer data is available, once per process.
+# The deploy scripts prefetch it at build time, so the common case is a
+# local lookup; downloading is only a fallback for bare machines.
+@st.cache_resource
+def _ensure_punkt():
+    # nltk 3.9 moved sent_tokenize onto punkt_tab; sumy's tokenizer
+    # still loads the punkt pickle, so both resources are needed
+    for resource in ('punkt', 'punkt_tab'):
+        try:
+            nltk.data.find(f'tokenizers/{resource}')
+        except LookupError:
+            nltk.download(resource, quiet=True)
+    return True
+
+# Load Firebase credentials exactly once per process
+@st.cache_resource
+def _load_firebase_credentials():
+    # Get Firebase credentials from environment variables
+    firebase_creds = os.environ.get("FIREBASE_CREDENTIALS")
+
+    if firebase_creds:
+        # Load credentials from environment variable (JSON string)
+        cred_dict = json.loads(firebase_creds)
+        return credentials.Certificate(cred_dict)
+
+    # Fallback to file if environment variable is not set
+    return credentials.Certificate("firebase-credentials.json")
 
 # Initialize Firebase
 @st.cache_resource
@@ -27,33 +67,121 @@ def initialize_firebase():
     try:
         # Check if the app is already initialized
         if not firebase_admin._apps:
-            # Get Firebase credentials from environment variables
-            firebase_creds = os.environ.get("FIREBASE_CREDENTIALS")
-            
-            if firebase_creds:
-                # Load credentials from environment variable (JSON string)
-                cred_dict = json.loads(firebase_creds)
-                cred = credentials.Certificate(cred_dict)
-            else:
-                # Fallback to file if environment variable is not set
-                cred = credentials.Certificate("firebase-credentials.json")
-                
-            firebase_admin.initialize_app(cred)
-            
+            firebase_admin.initialize_app(_load_firebase_credentials())
+
         return firestore.client()
     except Exception as e:
         st.error(f"Firebase initialization error: {str(e)}")
         return None
 
+# Reuse one translator per target language and thread: deep-translator
+# stages each request's payload on the instance, so a single shared
+# instance would let concurrent chunks overwrite each other's query
+_translators = threading.local()
+
+def get_translator(lang_code):
+    cache = getattr(_translators, 'by_lang', None)
+    if cache is None:
+        cache = _translators.by_lang = {}
+    if lang_code not in cache:
+        cache[lang_code] = translate(source='auto', target=lang_code)
+    return cache[lang_code]
+
+# Function to translate long text in concurrent chunks
+def translate_batched(text, lang_code, chunk_chars=4000, workers=8):
+    """Splits text on sentence boundaries and translates the chunks concurrently."""
+    # Short inputs don't need chunking overhead
+    if len(text) <= chunk_chars:
+        return get_translator(lang_code).translate(text)
+
+    _ensure_punkt()
+
+    # Group sentences into chunks below Google Translate's size limit
+    chunks = []
+    current, current_len = [], 0
+    for sentence in nltk.sent_tokenize(text):
+        if current and current_len + len(sentence) > chunk_chars:
+            chunks.append(" ".join(current))
+            current, current_len = [], 0
+        current.append(sentence)
+        current_len += len(sentence) + 1
+    if current:
+        chunks.append(" ".join(current))
+
+    # Keep several HTTP requests in flight; map preserves chunk order
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        translated_chunks = list(pool.map(
+            lambda chunk: get_translator(lang_code).translate(chunk),
+            chunks
+        ))
+
+    return " ".join(translated_chunks)
+
+# Function to translate text
+@st.cache_data(show_spinner=False, max_entries=128)
+def do_translate(text, lang_code):
+    """Translates text to the target language, memoized on (text, lang_code)."""
+    return translate_batched(text, lang_code)
+
+# Build the summarization pipeline once: the tokenizer loads punkt
+# pickles from disk and the summarizer rebuilds its stop-word list,
+# neither of which needs repeating per call
+@st.cache_resource
+def _summarizer_pipeline():
+    from sumy.nlp.stemmers import Stemmer
+    from sumy.utils import get_stop_words
+
+    _ensure_punkt()
+    tokenizer = Tokenizer("english")
+    summarizer = LsaSummarizer(Stemmer("english"))
+    summarizer.stop_words = get_stop_words("english")
+    return tokenizer, summarizer
+
+# Function to summarize long text with vectorized TextRank
+def summarize_text_fast(text, sentences_count=3):
+    """Summarizes long text via TF-IDF cosine similarity and power iteration."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    _ensure_punkt()
+    sentences = nltk.sent_tokenize(text)
+    if len(sentences) <= sentences_count:
+        return text
+
+    # Sparse TF-IDF cosine similarity; the matrix products run in BLAS
+    # instead of sumy's pure-Python SVD path
+    matrix = TfidfVectorizer(stop_words='english').fit_transform(sentences)
+    similarity = (matrix @ matrix.T).toarray()
+    np.fill_diagonal(similarity, 0.0)
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    row_sums[row_sums == 0] = 1.0
+    transition = similarity / row_sums
+
+    # Power iteration for PageRank-style sentence scores
+    damping = 0.85
+    scores = np.full(len(sentences), 1.0 / len(sentences))
+    for _ in range(20):
+        scores = (1 - damping) / len(sentences) + damping * (transition.T @ scores)
+
+    # Keep the top sentences in their original order
+    top = sorted(np.argsort(scores)[-sentences_count:])
+    return " ".join(sentences[i] for i in top)
+
 # Function to summarize text
+@st.cache_data(show_spinner=False, max_entries=128)
 def summarize_text(text, sentences_count=3):
     """Summarizes the given text using LSA summarizer."""
     try:
         if not text.strip():
             return "No text to summarize."
-        
-        parser = PlaintextParser.from_string(text, Tokenizer("english"))
-        summarizer = LsaSummarizer()
+
+        # Long documents take the vectorized TextRank path; LSA's SVD
+        # grows roughly cubically with sentence count
+        _ensure_punkt()
+        if len(nltk.sent_tokenize(text)) >= 20:
+            return summarize_text_fast(text, sentences_count)
+
+        tokenizer, summarizer = _summarizer_pipeline()
+        parser = PlaintextParser.from_string(text, tokenizer)
         summary = summarizer(parser.document, sentences_count)
         
         if not summary:
@@ -65,30 +193,112 @@ def summarize_text(text, sentences_count=3):
         return "Error occurred during summarization."
 
 # Function to convert text to speech
+@st.cache_data(show_spinner=False, max_entries=128)
 def text_to_speech(text, lang_code):
-    """Converts text to speech and returns the file path."""
+    """Converts text to speech and returns the MP3 bytes."""
     try:
         if not text.strip():
             return None
-            
-        # Create a temporary file for the audio
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_audio:
-            audio_path = temp_audio.name
-            
-        tts = gTTS(text=text, lang=lang_code)
-        tts.save(audio_path)
-        return audio_path
+
+        # Render the MP3 straight into memory; no temp file to write,
+        # re-read, and clean up
+        buf = io.BytesIO()
+        gTTS(text=text, lang=lang_code).write_to_fp(buf)
+        return buf.getvalue()
     except Exception as e:
         st.error(f"Text-to-speech error: {str(e)}")
         return None
 
+# Lock around the shared Tesseract API since Streamlit may serve
+# concurrent sessions from multiple threads
+_tess_lock = threading.Lock()
+
+# Background pool for Firestore writes so the UI never blocks on them
+_FIRE_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Failed background saves are recorded per session and surfaced by
+# main() on that session's next rerun; st.warning/st.error are no-ops
+# on pool threads. The lock orders the pool thread's append against
+# the script thread's drain.
+_fail_lock = threading.Lock()
+
+def _session_failed_saves():
+    """Returns this session's failure list, creating it on first use."""
+    return st.session_state.setdefault("_failed_saves", [])
+
+def _record_save_result(failures, future):
+    """Done-callback that notes a failed background Firestore write."""
+    try:
+        msg = None if future.result() else "Background save to the database failed."
+    except Exception as e:
+        msg = f"Background save to the database failed: {str(e)}"
+    if msg:
+        with _fail_lock:
+            failures.append(msg)
+
+# Initialize the persistent Tesseract API
+@st.cache_resource
+def get_tess_api(lang="eng", psm=6):
+    """Returns a persistent tesserocr API, kept alive across reruns."""
+    api = tesserocr.PyTessBaseAPI(lang=lang, oem=tesserocr.OEM.LSTM_ONLY, psm=psm)
+    # Inverted-text detection is wasted work on ordinary document uploads
+    api.SetVariable("tessedit_do_invert", "0")
+    return api
+
+# Function to clean up an image before OCR
+def _preprocess(image, min_height=600):
+    """Converts an image to a clean binarized grayscale for faster, more accurate OCR."""
+    arr = np.array(image.convert("L"))
+    height, width = arr.shape
+    # Upscale small crops so glyphs reach a size Tesseract's LSTM handles well
+    if height < min_height:
+        scale = min_height / height
+        arr = cv2.resize(arr, (int(width * scale), min_height), interpolation=cv2.INTER_CUBIC)
+    # Otsu thresholding strips color/background noise, leaving clean binary text
+    _, binarized = cv2.threshold(arr, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    return Image.fromarray(binarized)
+
+# Function to fingerprint uploaded content
+def content_digest(data):
+    """Returns a short stable digest used as the cache key for an upload."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+# Lazy payload for download buttons: the bytes are materialized only
+# when the user actually clicks, not on every rerun
+def _lazy_bytes(text):
+    return lambda: text.encode("utf-8")
+
 # Function to extract text from an image
-def extract_text_from_image(image):
-    """Extracts text from an uploaded image using Tesseract OCR."""
+def extract_text_from_image(image, psm=6):
+    """Extracts text from an uploaded image using Tesseract OCR.
+
+    The default --psm 6 (uniform block of text) skips the orientation
+    and page-layout analysis that --psm 3 runs before recognition;
+    pass psm=3 for documents with complex layouts.
+    """
     try:
-        # Tesseract is installed system-wide on Replit
-        # No need to set the path explicitly as in Windows
-        text = pytesseract.image_to_string(image)
+        # Clamp huge phone photos early: OCR cost scales with pixel count,
+        # and printed text stays legible well below 2000 px
+        if max(image.size) > 2000:
+            image = image.copy()
+            image.thumbnail((2000, 2000), Image.LANCZOS)
+
+        image = _preprocess(image)
+        if tesserocr is not None:
+            # Feed the in-memory PIL image straight to the persistent API,
+            # skipping the per-call subprocess spawn and model reload
+            with _tess_lock:
+                api = get_tess_api(psm=psm)
+                api.SetImage(image)
+                text = api.GetUTF8Text()
+        else:
+            # Tesseract is installed system-wide on Replit
+            # No need to set the path explicitly as in Windows
+            # --oem 1 forces the LSTM-only engine (skips legacy engine init)
+            text = pytesseract.image_to_string(
+                image, lang="eng",
+                config=f"--oem 1 --psm {psm} -c tessedit_do_invert=0"
+            )
         if not text.strip():
             return "No text detected in the image."
         return text
@@ -96,6 +306,68 @@ def extract_text_from_image(image):
         st.error(f"OCR error: {str(e)}")
         return "Error occurred during text extraction."
 
+# Cached OCR front-end keyed on the upload's content digest, so reruns
+# hash 16 bytes instead of the image's full pixel buffer
+@st.cache_data(show_spinner=False, max_entries=128)
+def extract_text_cached(content_hash, psm=6):
+    image = Image.open(io.BytesIO(st.session_state["_raw"][content_hash]))
+    return extract_text_from_image(image, psm=psm)
+
+# Function to fetch translation history
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_history(filter_type, filter_language, limit=10):
+    """Fetches recent history rows, filtered and ordered server-side."""
+    from google.cloud.firestore_v1 import FieldFilter
+
+    db = initialize_firebase()
+    if not db:
+        return None
+
+    # Push filtering into Firestore; the composite indexes in
+    # firestore.indexes.json cover each filter combination
+    query = db.collection('translations')
+    if filter_type != "All":
+        query = query.where(filter=FieldFilter(
+            "source_type", "==", "text_file" if filter_type == "Text File" else "image"
+        ))
+    if filter_language != "All":
+        query = query.where(filter=FieldFilter("target_language", "==", filter_language))
+
+    # Project only the list-view metadata and let the server apply
+    # ordering and the limit, so exactly `limit` small rows come back;
+    # the large text fields are fetched per record on demand
+    query = query.select(["source_type", "target_language", "timestamp"])
+    query = query.order_by("timestamp", direction=firestore.Query.DESCENDING).limit(limit)
+
+    return [{"id": doc.id, **doc.to_dict()} for doc in query.get()]
+
+# Function to fetch one full history record
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_history_doc(doc_id):
+    """Fetches the full text fields of a single history record."""
+    db = initialize_firebase()
+    if not db:
+        return None
+
+    doc = db.collection('translations').document(doc_id).get()
+    return doc.to_dict() if doc.exists else None
+
+# Content-addressed document id: the same text/language pair always
+# maps to the same document, so duplicate saves become idempotent
+def _translation_doc_id(lang_code, text):
+    return hashlib.sha1(f"{lang_code}|{text}".encode()).hexdigest()
+
+# Function to look up a previously stored translation
+@st.cache_data(ttl=300, show_spinner=False)
+def lookup_existing(text, lang_code):
+    """Returns the stored record for this text/language pair, if any."""
+    db = initialize_firebase()
+    if not db:
+        return None
+
+    doc = db.collection('translations').document(_translation_doc_id(lang_code, text)).get()
+    return doc.to_dict() if doc.exists else None
+
 # Function to save data to Firebase
 def save_to_firebase(data):
     """Saves the processed data to Firebase Firestore."""
@@ -105,16 +377,18 @@ def save_to_firebase(data):
         if not db:
             st.warning("Firebase connection not available. Data will not be saved.")
             return False
-            
-        # Generate a unique ID for the document
-        doc_id = str(uuid.uuid4())
-        
+
+        # Address the document by content so re-translations of the same
+        # snippet overwrite their own record instead of piling up
+        doc_id = _translation_doc_id(data.get("target_language_code", ""),
+                                     data.get("original_text", ""))
+
         # Add timestamp
         data['timestamp'] = datetime.datetime.now().isoformat()
-        
+
         # Save to Firestore
-        db.collection('translations').document(doc_id).set(data)
-        
+        db.collection('translations').document(doc_id).set(data, merge=True)
+
         return True
     except Exception as e:
         st.error(f"Firebase save error: {str(e)}")
@@ -125,6 +399,15 @@ def main():
     st.title("File & Image Translator with Summarization & Speech")
     st.write("Upload a text file or an image, translate it, summarize the translated text, and listen to it.")
 
+    # Report any of this session's background saves that failed since
+    # the last rerun
+    failures = _session_failed_saves()
+    with _fail_lock:
+        pending_failures = failures[:]
+        failures.clear()
+    for msg in pending_failures:
+        st.warning(msg)
+
     # Add a sidebar with app information
     with st.sidebar:
         st.header("About")
@@ -160,8 +443,16 @@ def main():
         
         if uploaded_file:
             try:
-                # Read the file content
-                file_contents = uploaded_file.read().decode("utf-8")
+                # Decode the file once per upload; reruns reuse the pinned
+                # copy. The digest keeps a re-upload of an edited file with
+                # the same name and length from showing stale contents
+                raw_bytes = uploaded_file.getvalue()
+                file_key = (uploaded_file.name, uploaded_file.size, content_digest(raw_bytes))
+                if st.session_state.get("file_key") != file_key:
+                    st.session_state["file_contents"] = raw_bytes.decode("utf-8")
+                    st.session_state["file_key"] = file_key
+                file_contents = st.session_state["file_contents"]
+
                 st.subheader("Original Text")
                 st.text_area("", file_contents, height=150)
                 
@@ -175,13 +466,38 @@ def main():
         
         if uploaded_image:
             try:
+                # Decode and fingerprint the upload once; reruns reuse the
+                # pinned image object and digest instead of re-reading. The
+                # digest in the key catches same-name, same-size re-uploads
+                image_bytes = uploaded_image.getvalue()
+                content_hash = content_digest(image_bytes)
+                image_key = (uploaded_image.name, uploaded_image.size, content_hash)
+                if st.session_state.get("image_key") != image_key:
+                    st.session_state.setdefault("_raw", {})[content_hash] = image_bytes
+                    st.session_state["image_key"] = image_key
+                    st.session_state["image_hash"] = content_hash
+                    st.session_state["image_obj"] = Image.open(io.BytesIO(image_bytes))
+                content_hash = st.session_state["image_hash"]
+                image = st.session_state["image_obj"]
+
                 # Display the uploaded image
-                image = Image.open(uploaded_image)
-                st.image(image, caption="Uploaded Image", use_column_width=True)
-                
+                st.image(image, caption="Uploaded Image", width="stretch")
+
+                # Most uploads are plain text blocks; auto layout re-enables
+                # Tesseract's orientation and page-segmentation analysis
+                layout_mode = st.radio(
+                    "Page layout",
+                    ["Single-column text", "Auto layout"],
+                    horizontal=True,
+                    key="ocr_layout"
+                )
+
                 # Extract text from image
                 with st.spinner("Extracting text from image..."):
-                    extracted_text = extract_text_from_image(image)
+                    extracted_text = extract_text_cached(
+                        content_hash,
+                        psm=6 if layout_mode == "Single-column text" else 3
+                    )
                 
                 if extracted_text and extracted_text != "No text detected in the image." and extracted_text != "Error occurred during text extraction.":
                     st.subheader("Extracted Text from Image")
@@ -223,80 +539,76 @@ def main():
                 
                 # Add refresh button
                 if st.button("Refresh History", key="refresh_history"):
+                    fetch_history.clear()
                     st.rerun()
-                
+
                 # Query Firestore
                 with st.spinner("Loading history..."):
-                    # Get collection reference
-                    translations_ref = db.collection('translations')
-                    
-                    # Apply filters if selected
-                    if filter_type != "All" and filter_language != "All":
-                        query = translations_ref.where(
-                            "source_type", "==", "text_file" if filter_type == "Text File" else "image"
-                        ).where("target_language", "==", filter_language)
-                    elif filter_type != "All":
-                        query = translations_ref.where(
-                            "source_type", "==", "text_file" if filter_type == "Text File" else "image"
-                        )
-                    elif filter_language != "All":
-                        query = translations_ref.where("target_language", "==", filter_language)
-                    else:
-                        query = translations_ref
-                    
-                    # Order by timestamp (most recent first)
-                    translations = query.order_by("timestamp", direction=firestore.Query.DESCENDING).limit(10).get()
-                    
+                    translations = fetch_history(filter_type, filter_language)
+
                     if not translations:
                         st.info("No translation history found. Translate some text to see it here!")
                     else:
                         # Display results
-                        for i, doc in enumerate(translations):
-                            data = doc.to_dict()
-                            
+                        for i, data in enumerate(translations):
+                            doc_id = data["id"]
+
                             # Create an expander for each record
                             with st.expander(f"Translation {i+1} - {data.get('target_language', 'Unknown')} ({data.get('timestamp', 'Unknown date')})"):
                                 st.markdown(f"**Source Type:** {'Image' if data.get('source_type') == 'image' else 'Text File'}")
                                 st.markdown(f"**Target Language:** {data.get('target_language', 'Unknown')}")
-                                
+
+                                # Fetch the large text fields only once the user
+                                # asks for them, so closed records cost nothing
+                                if not st.session_state.get(f"opened_{doc_id}"):
+                                    if st.button("Load details", key=f"load_{doc_id}"):
+                                        st.session_state[f"opened_{doc_id}"] = True
+                                        st.rerun()
+                                    continue
+
+                                details = fetch_history_doc(doc_id)
+                                if not details:
+                                    st.warning("Record could not be loaded.")
+                                    continue
+
                                 # Original text
                                 st.subheader("Original Text")
-                                st.text_area("", data.get("original_text", ""), height=100, key=f"history_original_{i}")
-                                
+                                st.text_area("", details.get("original_text", ""), height=100, key=f"history_original_{i}")
+
                                 # Translated text
                                 st.subheader("Translated Text")
-                                st.text_area("", data.get("translated_text", ""), height=100, key=f"history_translated_{i}")
-                                
+                                st.text_area("", details.get("translated_text", ""), height=100, key=f"history_translated_{i}")
+
                                 # Summary
                                 st.subheader("Summary")
-                                st.text_area("", data.get("summary", ""), height=100, key=f"history_summary_{i}")
-                                
+                                st.text_area("", details.get("summary", ""), height=100, key=f"history_summary_{i}")
+
                                 # Download buttons
                                 col1, col2, col3 = st.columns(3)
-                                
+
                                 with col1:
                                     st.download_button(
-                                        "Download Original", 
-                                        data.get("original_text", ""), 
-                                        file_name=f"original_{i+1}.txt", 
+                                        "Download Original",
+                                        data=_lazy_bytes(details.get("original_text", "")),
+                                        file_name=f"original_{i+1}.txt",
                                         mime="text/plain",
                                         key=f"dl_orig_{i}"
                                     )
-                                
+
                                 with col2:
                                     st.download_button(
-                                        "Download Translation", 
-                                        data.get("translated_text", ""), 
-                                        file_name=f"translated_{i+1}.txt", 
+                                        "Download Translation",
+                                        data=_lazy_bytes(details.get("translated_text", "")),
+                                        file_name=f"translated_{i+1}.txt",
                                         mime="text/plain",
                                         key=f"dl_trans_{i}"
                                     )
-                                
+
                                 with col3:
                                     st.download_button(
-                                        "Download Summary", 
-                                        data.get("summary", ""), 
-                                        file_name=f"summary_{i+1}.txt", 
+                                        "Download Summary",
+                                        data=_lazy_bytes(details.get("summary", "")),
+                                        file_name=f"summary_{i+1}.txt",
                                         mime="text/plain",
                                         key=f"dl_summary_{i}"
                                     )
@@ -328,39 +640,33 @@ def process_text(text, language_map, source_is_image=False):
     if translate_btn:
         with st.spinner("Translating..."):
             try:
-                # Translate the content
-                translated_text = translate(source='auto', target=lang_code).translate(text)
-                
+                # Read-through: a repeat of the same text/language pair is
+                # answered by a single Firestore read instead of re-running
+                # the whole translate/summarize pipeline
+                existing = lookup_existing(text, lang_code)
+                if existing:
+                    translated_text = existing.get("translated_text", "")
+                    summary = existing.get("summary", "")
+                else:
+                    # Summarize the source first: the English summarizer
+                    # matches the source text rather than Hindi/Tamil/etc.
+                    # output, and the summary is a fraction of the characters
+                    # the full document sends through Google Translate
+                    summary_src = summarize_text(text)
+
+                    # Translate the full text and the summary concurrently
+                    with ThreadPoolExecutor(max_workers=2) as pool:
+                        fut_text = pool.submit(do_translate, text, lang_code)
+                        fut_summary = pool.submit(do_translate, summary_src, lang_code)
+                        translated_text = fut_text.result()
+                        summary = fut_summary.result()
+
                 # Display the translated text
                 st.subheader("Translated Text")
                 st.text_area("", translated_text, height=200, key=f"translated_{'image' if source_is_image else 'text'}")
-                
-                # Summarize the translated text
-                with st.spinner("Summarizing..."):
-                    summary = summarize_text(translated_text)
-                
-                st.subheader("Summarized Text")
-                st.text_area("", summary, height=150, key=f"summary_{'image' if source_is_image else 'text'}")
-                
-                # Convert to speech
-                with st.spinner("Generating audio..."):
-                    audio_path = text_to_speech(summary, lang_code)
-                
-                if audio_path:
-                    # Provide audio playback
-                    st.subheader("Listen to the Summary")
-                    with open(audio_path, "rb") as audio_file:
-                        audio_bytes = audio_file.read()
-                        st.audio(audio_bytes, format="audio/mp3")
-                    
-                    # Clean up the temporary file
-                    try:
-                        os.remove(audio_path)
-                    except:
-                        pass
-                
-                # Store data in Firebase
-                with st.spinner("Saving to database..."):
+
+                # Nothing to save when the record already existed
+                if not existing:
                     # Prepare data for Firebase
                     firebase_data = {
                         "original_text": text,
@@ -369,14 +675,34 @@ def process_text(text, language_map, source_is_image=False):
                         "target_language_code": lang_code,
                         "translated_text": translated_text,
                         "summary": summary,
-                        "has_audio": audio_path is not None
+                        "has_audio": bool(summary.strip())
                     }
-                    
-                    # Save to Firebase
-                    saved = save_to_firebase(firebase_data)
-                    if saved:
-                        st.success("Data saved to Firebase successfully!")
-                    
+
+                    # The Firestore write is fire-and-forget on the background
+                    # pool: the user doesn't need to wait on a network write,
+                    # and a failure is reported on the next rerun
+                    # The session's list is captured here, on the script
+                    # thread, since session state isn't reachable from the pool
+                    failures = _session_failed_saves()
+                    _FIRE_POOL.submit(save_to_firebase, firebase_data).add_done_callback(
+                        lambda fut, failures=failures: _record_save_result(failures, fut))
+                    st.toast("Saving to database in the background...")
+
+                # Render the audio while the text widgets build
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    fut_audio = pool.submit(text_to_speech, summary, lang_code)
+
+                    st.subheader("Summarized Text")
+                    st.text_area("", summary, height=150, key=f"summary_{'image' if source_is_image else 'text'}")
+
+                    with st.spinner("Generating audio..."):
+                        audio_bytes = fut_audio.result()
+
+                    if audio_bytes:
+                        # Provide audio playback
+                        st.subheader("Listen to the Summary")
+                        st.audio(audio_bytes, format="audio/mp3")
+
                 # Download buttons
                 st.subheader("Download Options")
                 col1, col2 = st.columns(2)
@@ -385,14 +711,14 @@ def process_text(text, language_map, source_is_image=False):
                     if source_is_image:
                         st.download_button(
                             "Download Extracted Text", 
-                            text, 
+                            data=_lazy_bytes(text), 
                             file_name="extracted_text.txt", 
                             mime="text/plain"
                         )
                     
                     st.download_button(
                         "Download Translated Text", 
-                        translated_text, 
+                        data=_lazy_bytes(translated_text), 
                         file_name=f"translated_{selected_language}.txt", 
                         mime="text/plain"
                     )
@@ -400,7 +726,7 @@ def process_text(text, language_map, source_is_image=False):
                 with col2:
                     st.download_button(
                         "Download Summary", 
-                        summary, 
+                        data=_lazy_bytes(summary), 
                         file_name=f"summarized_{selected_language}.txt", 
                         mime="text/plain"
                     )
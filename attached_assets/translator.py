@@ -1,39 +1,276 @@
+import os
+
+# Tesseract's OpenMP parallelism is slower than single-threaded on
+# typical machines; must be set before the OCR libraries are imported
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import streamlit as st
 from deep_translator import GoogleTranslator as translate
-from sumy.parsers.plaintext import PlaintextParser
-from sumy.nlp.tokenizers import Tokenizer
-from sumy.summarizers.lsa import LsaSummarizer
-from gtts import gTTS
-import os
-import nltk
-import pytesseract
-from PIL import Image
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import io
+import threading
+import numpy as np
+from PIL import Image, ImageOps
+
+# The heavy modules (sumy, nltk, gTTS, Tesseract) are deferred to first
+# use behind cached getters, so a cold page load that only renders the
+# widgets doesn't pay their import cost
+@functools.lru_cache(maxsize=None)
+def _get_nltk():
+    import nltk
+    # nltk 3.9 moved sent_tokenize onto punkt_tab; sumy's tokenizer
+    # still loads the punkt pickle, so both resources are needed
+    for resource in ('punkt', 'punkt_tab'):
+        try:
+            nltk.data.find(f'tokenizers/{resource}')
+        except LookupError:
+            nltk.download(resource)
+    return nltk
+
+@functools.lru_cache(maxsize=None)
+def _get_gtts():
+    from gtts import gTTS
+    return gTTS
+
+@functools.lru_cache(maxsize=None)
+def _get_ocr():
+    import pytesseract
+
+    # Honor an explicit binary location; otherwise rely on PATH, which
+    # also lets deployments point at a fast AVX2-enabled build
+    _cmd = os.environ.get("TESSERACT_CMD")
+    if _cmd:
+        pytesseract.pytesseract.tesseract_cmd = _cmd
+
+    # tesserocr keeps the Tesseract API (and its language models) loaded
+    # in-process; pytesseract shells out and reloads them on every call
+    try:
+        from tesserocr import PyTessBaseAPI, PSM
+    except ImportError:
+        PyTessBaseAPI = PSM = None
+
+    return pytesseract, PyTessBaseAPI, PSM
+
+@functools.lru_cache(maxsize=None)
+def _sumy_components():
+    from sumy.parsers.plaintext import PlaintextParser
+    from sumy.nlp.stemmers import Stemmer
+    from sumy.nlp.tokenizers import Tokenizer
+    from sumy.summarizers.luhn import LuhnSummarizer
+    from sumy.utils import get_stop_words
+
+    _get_nltk()
+    # The tokenizer loads NLTK's punkt pickle and the summarizer builds
+    # its stemmer and stop-word set; construct both exactly once
+    tokenizer = Tokenizer("english")
+    summarizer = LuhnSummarizer(Stemmer("english"))
+    summarizer.stop_words = get_stop_words("english")
+    return PlaintextParser, tokenizer, summarizer
+
+# One translator per language pair and thread, so the HTTP session
+# isn't rebuilt on every call: deep-translator stages each request's
+# payload on the instance, so the concurrent miss fetch in
+# translate_long must not share one across threads
+_translators = threading.local()
+
+def get_translator(src, tgt):
+    cache = getattr(_translators, 'by_pair', None)
+    if cache is None:
+        cache = _translators.by_pair = {}
+    if (src, tgt) not in cache:
+        cache[(src, tgt)] = translate(source=src, target=tgt)
+    return cache[(src, tgt)]
+
+# Codes Google actually accepts, keyed by lowercase for matching
+# langdetect's output (e.g. zh-cn -> zh-CN, and 'he' is Google's 'iw')
+@functools.lru_cache(maxsize=None)
+def _supported_codes():
+    codes = translate().get_supported_languages(as_dict=True).values()
+    mapping = {code.lower(): code for code in codes}
+    mapping.setdefault('he', 'iw')
+    return mapping
+
+# Function to detect the source language once per text
+def detect_source(text):
+    """Detects the source language locally, falling back to server-side auto."""
+    try:
+        from langdetect import detect
+        detected = detect(text[:2000])
+        # langdetect codes don't always match Google's (case and a few
+        # aliases differ); anything unmapped falls back to server-side auto
+        return _supported_codes().get(detected.lower(), 'auto')
+    except Exception:
+        return 'auto'
+
+# Sentence-level translation cache: repeated sentences (common in
+# uploaded documents) cost a dict lookup instead of a network round-trip.
+# A plain dict (unlike lru_cache) lets translate_long check for misses
+# up front and fetch only those
+_TR_CACHE = {}
+_TR_CACHE_MAX = 10000
+
+def _tr(src, tgt, sentence):
+    key = (src, tgt, sentence)
+    cached = _TR_CACHE.get(key)
+    if cached is None:
+        if len(_TR_CACHE) >= _TR_CACHE_MAX:
+            _TR_CACHE.clear()
+        cached = _TR_CACHE[key] = get_translator(src, tgt).translate(sentence)
+    return cached
+
+# Google rejects payloads over 5000 characters, so a single "sentence"
+# longer than that (unpunctuated input) is split on spaces below the limit
+def _split_oversize(sentence, limit=4500):
+    if len(sentence) <= limit:
+        return [sentence]
+    parts = []
+    while len(sentence) > limit:
+        cut = sentence.rfind(" ", 0, limit)
+        if cut <= 0:
+            cut = limit
+        parts.append(sentence[:cut])
+        sentence = sentence[cut:].lstrip()
+    if sentence:
+        parts.append(sentence)
+    return parts
+
+# Function to translate long text without hitting Google's size limit
+@st.cache_data(show_spinner=False, max_entries=64)
+def translate_long(text, lang):
+    """Translates text sentence-by-sentence, fetching cache misses concurrently."""
+    # Detect once locally instead of making Google re-detect every
+    # sentence, which also keeps the cache key stable across a document
+    src = detect_source(text)
+
+    # Nothing to translate when the text is already in the target language
+    if src == lang:
+        return text
+
+    if len(text) <= 4500:
+        return _tr(src, lang, text)
+
+    nltk = _get_nltk()
+    sentences = [p for s in nltk.sent_tokenize(text) for p in _split_oversize(s)]
 
-# Set Tesseract OCR path
-pytesseract.pytesseract.tesseract_cmd = r"C:\Users\chall\Desktop\tesseract-ocr-w64-setup-5.5.0.20241111.exe"
+    # Only the sentences the cache hasn't seen cost a round-trip, and
+    # those run in parallel instead of one request at a time
+    misses = list({s for s in sentences if (src, lang, s) not in _TR_CACHE})
+    if misses:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda s: _tr(src, lang, s), misses))
+    return " ".join(_tr(src, lang, s) for s in sentences)
 
-nltk.download('punkt')
+# Function to stream-translate an uploaded text file
+def translate_stream(fileobj, lang, chunk_chars=4500):
+    """Reads, chunks, and translates an uploaded file without buffering it twice."""
+    nltk = _get_nltk()
+    reader = io.TextIOWrapper(fileobj, encoding='utf-8', errors='replace')
+
+    # Accumulate sentence-aligned chunks on the fly; only the current
+    # chunk of source text is held alongside the growing translation
+    translated_parts = []
+    pending = ""
+    while True:
+        block = reader.read(chunk_chars)
+        if not block:
+            break
+        pending += block
+        sentences = nltk.sent_tokenize(pending)
+        if len(sentences) > 1:
+            # Keep the last, possibly incomplete sentence for the next block
+            translated_parts.append(translate_long(" ".join(sentences[:-1]), lang))
+            pending = sentences[-1]
+        if len(pending) > chunk_chars:
+            # Unpunctuated input tokenizes as one ever-growing sentence;
+            # flush it anyway so only one chunk stays buffered
+            translated_parts.append(translate_long(pending, lang))
+            pending = ""
+    if pending.strip():
+        translated_parts.append(translate_long(pending, lang))
+
+    return " ".join(translated_parts)
 
 # Function to summarize text
+@st.cache_data(show_spinner=False, max_entries=64)
 def summarize_text(text, sentences_count=3):
-    """Summarizes the given text using LSA summarizer."""
-    parser = PlaintextParser.from_string(text, Tokenizer("english"))
-    summarizer = LsaSummarizer()
+    """Summarizes the given text using Luhn summarizer."""
+    PlaintextParser, tokenizer, summarizer = _sumy_components()
+    parser = PlaintextParser.from_string(text, tokenizer)
     summary = summarizer(parser.document, sentences_count)
     return " ".join(str(sentence) for sentence in summary)
 
 # Function to convert text to speech
-def text_to_speech(text, lang_code):
-    """Converts text to speech and returns the file path."""
-    tts = gTTS(text=text, lang=lang_code)
-    audio_path = "translated_speech.mp3"
-    tts.save(audio_path)
-    return audio_path
+def text_to_speech_bytes(text, lang_code):
+    """Converts text to speech and returns the MP3 bytes."""
+    gTTS = _get_gtts()
+    buf = io.BytesIO()
+    gTTS(text=text, lang=lang_code).write_to_fp(buf)
+    return buf.getvalue()
+
+# The tesserocr API holds one image at a time, so concurrent OCR of
+# multiple uploads must take turns on it
+_tess_lock = threading.Lock()
+
+# Initialize the persistent Tesseract API once per process
+@st.cache_resource
+def get_tess_api():
+    """Returns a persistent tesserocr API shared across reruns."""
+    _, PyTessBaseAPI, PSM = _get_ocr()
+    return PyTessBaseAPI(lang='eng', psm=PSM.SINGLE_BLOCK)
+
+# Function to clean up an image before OCR
+def _preprocess(image):
+    """Grayscales, downscales, and binarizes an image so Tesseract scans less."""
+    img = image.convert('L')
+
+    # OCR cost scales with pixel count; printed text stays legible below 2000 px
+    if max(img.size) > 2000:
+        img.thumbnail((2000, 2000), Image.LANCZOS)
+    img = ImageOps.autocontrast(img)
+
+    # Otsu threshold: pick the split that maximizes between-class variance
+    arr = np.array(img)
+    hist, _ = np.histogram(arr, bins=256, range=(0, 256))
+    weights = np.cumsum(hist).astype(float)
+    means = np.cumsum(hist * np.arange(256)).astype(float)
+    w_bg, w_fg = weights, arr.size - weights
+    m_bg = means / np.maximum(w_bg, 1)
+    m_fg = (means[-1] - means) / np.maximum(w_fg, 1)
+    var_between = w_bg * w_fg * (m_bg - m_fg) ** 2
+    threshold = int(var_between.argmax())
+
+    return img.point(lambda p: 255 if p > threshold else 0)
 
 # Function to extract text from an image
+@st.cache_data(show_spinner=False, max_entries=64,
+               hash_funcs={Image.Image: lambda im: hashlib.md5(im.tobytes()).hexdigest()})
 def extract_text_from_image(image):
     """Extracts text from an uploaded image using Tesseract OCR."""
-    return pytesseract.image_to_string(image)
+    pytesseract, PyTessBaseAPI, _ = _get_ocr()
+    image = _preprocess(image)
+    if PyTessBaseAPI is not None:
+        api = get_tess_api()
+        with _tess_lock:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+    # --oem 1 skips legacy-engine init; --psm 6 (uniform block of text)
+    # skips full page-layout analysis and orientation detection
+    return pytesseract.image_to_string(image, lang='eng', config='--oem 1 --psm 6')
+
+# Async wrapper so the Tesseract subprocess doesn't block the event loop
+async def _extract_async(image):
+    return await asyncio.to_thread(extract_text_from_image, image)
+
+# Function to OCR several images concurrently
+def extract_text_from_images(images):
+    """Runs OCR on all uploaded images concurrently and joins the results."""
+    async def _gather():
+        return await asyncio.gather(*(_extract_async(img) for img in images))
+
+    return "\n".join(asyncio.run(_gather()))
 
 # Main Streamlit App
 def main():
@@ -43,8 +280,8 @@ def main():
     # File uploader for text files
     uploaded_file = st.file_uploader("Upload a text file", type=["txt"])
 
-    # Image uploader
-    uploaded_image = st.file_uploader("Upload an image file", type=["png", "jpg", "jpeg"])
+    # Image uploader; multiple pages are OCRed concurrently
+    uploaded_images = st.file_uploader("Upload an image file", type=["png", "jpg", "jpeg"], accept_multiple_files=True)
 
     # Language options
     language_map = {
@@ -65,11 +302,9 @@ def main():
         lang_code = language_map[selected_language]
 
         if uploaded_file:
-            # Read the file content
-            file_contents = uploaded_file.read().decode("utf-8")
-
-            # Translate the content
-            translated_text = translate(source='auto', target=lang_code).translate(file_contents)
+            # Stream-decode and translate the file chunk by chunk instead
+            # of buffering the raw bytes and the decoded copy at once
+            translated_text = translate_stream(uploaded_file, lang_code)
 
             # Display the translated text
             st.subheader("Translated Text")
@@ -77,33 +312,37 @@ def main():
 
             # Summarize the translated text
             summary = summarize_text(translated_text)
-            st.subheader("Summarized Text")
-            st.text_area("", summary, height=150)
 
-            # Convert to speech
-            audio_path = text_to_speech(summary, lang_code)
+            # Start the gTTS request now so it overlaps with rendering
+            # the summary widgets; a blank summary gets no audio call
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                tts_future = pool.submit(text_to_speech_bytes, summary, lang_code) if summary.strip() else None
+
+                st.subheader("Summarized Text")
+                st.text_area("", summary, height=150)
 
-            # Provide audio playback
-            st.subheader("Listen to the Summary")
-            with open(audio_path, "rb") as audio_file:
-                audio_bytes = audio_file.read()
-                st.audio(audio_bytes, format="audio/mp3")
+                # Provide audio playback
+                if tts_future:
+                    audio_bytes = tts_future.result()
+                    st.subheader("Listen to the Summary")
+                    st.audio(audio_bytes, format="audio/mp3")
 
-            # Download buttons
-            st.download_button("Download Translated File", translated_text, file_name=f"translated_{selected_language}.txt", mime="text/plain")
-            st.download_button("Download Summarized File", summary, file_name=f"summarized_{selected_language}.txt", mime="text/plain")
+            # Download buttons; encode once instead of letting Streamlit
+            # keep a second UTF-8 copy of each large string
+            st.download_button("Download Translated File", translated_text.encode('utf-8'), file_name=f"translated_{selected_language}.txt", mime="text/plain; charset=utf-8")
+            st.download_button("Download Summarized File", summary.encode('utf-8'), file_name=f"summarized_{selected_language}.txt", mime="text/plain; charset=utf-8")
 
-        elif uploaded_image:
-            # Open and process the image
-            image = Image.open(uploaded_image)
-            extracted_text = extract_text_from_image(image)
+        elif uploaded_images:
+            # Open the images and OCR them concurrently
+            images = [Image.open(uploaded) for uploaded in uploaded_images]
+            extracted_text = extract_text_from_images(images)
 
             if extracted_text.strip():
                 st.subheader("Extracted Text from Image")
                 st.text_area("", extracted_text, height=150)
 
                 # Translate the extracted text
-                translated_text = translate(source='auto', target=lang_code).translate(extracted_text)
+                translated_text = translate_long(extracted_text, lang_code)
 
                 # Display the translated text
                 st.subheader("Translated Text")
@@ -111,22 +350,26 @@ def main():
 
                 # Summarize the translated text
                 summary = summarize_text(translated_text)
-                st.subheader("Summarized Text")
-                st.text_area("", summary, height=150)
 
-                # Convert to speech
-                audio_path = text_to_speech(summary, lang_code)
+                # Start the gTTS request now so it overlaps with rendering
+                # the summary widgets; a blank summary gets no audio call
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    tts_future = pool.submit(text_to_speech_bytes, summary, lang_code) if summary.strip() else None
 
-                # Provide audio playback
-                st.subheader("Listen to the Summary")
-                with open(audio_path, "rb") as audio_file:
-                    audio_bytes = audio_file.read()
-                    st.audio(audio_bytes, format="audio/mp3")
+                    st.subheader("Summarized Text")
+                    st.text_area("", summary, height=150)
+
+                    # Provide audio playback
+                    if tts_future:
+                        audio_bytes = tts_future.result()
+                        st.subheader("Listen to the Summary")
+                        st.audio(audio_bytes, format="audio/mp3")
 
-                # Download buttons
-                st.download_button("Download Extracted Text", extracted_text, file_name="extracted_text.txt", mime="text/plain")
-                st.download_button("Download Translated File", translated_text, file_name=f"translated_{selected_language}.txt", mime="text/plain")
-                st.download_button("Download Summarized File", summary, file_name=f"summarized_{selected_language}.txt", mime="text/plain")
+                # Download buttons; encode once instead of letting Streamlit
+                # keep a second UTF-8 copy of each large string
+                st.download_button("Download Extracted Text", extracted_text.encode('utf-8'), file_name="extracted_text.txt", mime="text/plain; charset=utf-8")
+                st.download_button("Download Translated File", translated_text.encode('utf-8'), file_name=f"translated_{selected_language}.txt", mime="text/plain; charset=utf-8")
+                st.download_button("Download Summarized File", summary.encode('utf-8'), file_name=f"summarized_{selected_language}.txt", mime="text/plain; charset=utf-8")
 
             else:
                 st.error("No text detected in the image. Please upload a clear image with readable text.")